@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
-from dataclasses import asdict
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Callable, Dict, Iterable, List, Sequence
 
 from . import __version__
 from .config import load_config
 from .io import load_raw_records
-from .metrics import DeviceUsage, compute_device_usage, normalize_records
+from .metrics import (
+    DailyUsage,
+    DeviceUsage,
+    compute_series_usage,
+    normalize_series,
+)
 
 DEFAULT_DATA_DIR = Path("bt-bracedata")
 
@@ -29,7 +34,10 @@ COLOR_ALWAYS = "always"
 COLOR_NEVER = "never"
 
 
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; parsers are reusable across ``parse_args``."""
+
     parser = argparse.ArgumentParser(description="Brace usage analyzer")
     parser.add_argument(
         "--data-dir",
@@ -100,21 +108,27 @@ def main(argv: Sequence[str] | None = None) -> None:
         parser.error(str(exc))
         return
 
-    hourly_records = normalize_records(raw_records)
+    hourly_series = normalize_series(raw_records)
     if args.devices:
         device_filter = set(args.devices)
-        hourly_records = [r for r in hourly_records if r.device_id in device_filter]
-        if not hourly_records:
+        hourly_series = {
+            device_id: series
+            for device_id, series in hourly_series.items()
+            if device_id in device_filter
+        }
+        if not hourly_series:
             print("No matching device data", file=sys.stderr)
             sys.exit(1)
 
     window_days = args.days if args.days is not None else config.window_days
 
-    usages = compute_device_usage(
-        hourly_records,
+    usages = compute_series_usage(
+        hourly_series,
         usage_threshold=config.usage_threshold_hours_per_day,
         temperature_threshold=config.temperature_threshold_fahrenheit,
         window_days=window_days,
+        # Only verbose text and JSON output report the below-threshold hours.
+        collect_below_threshold=args.verbose or args.json,
     )
 
     if args.json:
@@ -132,12 +146,36 @@ def main(argv: Sequence[str] | None = None) -> None:
 
 
 def _render_json(usages: Iterable[DeviceUsage]) -> str:
-    payload = []
-    for usage in usages:
-        entry = asdict(usage)
-        entry["days"] = [asdict(day) for day in usage.days]
-        payload.append(entry)
-    return json.dumps(payload, indent=2, sort_keys=True, default=str)
+    import json  # Deferred: only the --json path needs it.
+
+    payload = [_usage_payload(usage) for usage in usages]
+    return json.dumps(payload, indent=2, sort_keys=True)
+
+
+def _usage_payload(usage: DeviceUsage) -> Dict[str, object]:
+    """Convert ``usage`` to JSON-ready primitives by direct field access."""
+
+    return {
+        "device_id": usage.device_id,
+        "seven_day_average_hours_per_day": usage.seven_day_average_hours_per_day,
+        "overall_average_hours_per_day": usage.overall_average_hours_per_day,
+        "days": [_day_payload(day) for day in usage.days],
+        "threshold_met": usage.threshold_met,
+        "complete_days_last_seven": usage.complete_days_last_seven,
+        "complete_days_overall": usage.complete_days_overall,
+    }
+
+
+def _day_payload(day: DailyUsage) -> Dict[str, object]:
+    """Convert ``day`` to JSON-ready primitives, stringifying dates up front."""
+
+    return {
+        "day": str(day.day),
+        "hours_in_use": day.hours_in_use,
+        "below_threshold_hours": [str(hour) for hour in day.below_threshold_hours],
+        "samples_present": day.samples_present,
+        "is_complete": day.is_complete,
+    }
 
 
 def _render_text(
@@ -149,6 +187,8 @@ def _render_text(
     use_color: bool,
 ) -> str:
     lines: List[str] = []
+    below_prefix = f"    below {temp_threshold:.1f}°F at: "
+    colorize = _hours_colorizer(usage_threshold, use_color)
     for usage in usages:
         status = "meets goal" if usage.threshold_met else "needs improvement"
         lines.append(f"Device: {usage.device_id}")
@@ -156,18 +196,10 @@ def _render_text(
         recent_days = min(7, total_days)
         seven_day_text = f"{usage.seven_day_average_hours_per_day:.1f} hr/day"
         overall_text = f"{usage.overall_average_hours_per_day:.1f} hr/day"
-        seven_day_fragment = _colorize_hours_text(
-            seven_day_text,
-            hours=usage.seven_day_average_hours_per_day,
-            threshold=usage_threshold,
-            use_color=use_color,
-        )
-        overall_fragment = _colorize_hours_text(
-            overall_text,
-            hours=usage.overall_average_hours_per_day,
-            threshold=usage_threshold,
-            use_color=use_color,
+        seven_day_fragment = colorize(
+            seven_day_text, usage.seven_day_average_hours_per_day
         )
+        overall_fragment = colorize(overall_text, usage.overall_average_hours_per_day)
         avg_line = (
             "7-day avg: "
             f"{seven_day_fragment} (based on {usage.complete_days_last_seven}/{recent_days} days)"
@@ -176,53 +208,55 @@ def _render_text(
         )
         lines.append(avg_line)
         for day in usage.days:
-            weekday = day.day.strftime("%a %Y-%m-%d")
             hours = day.hours_in_use
-            suffix = "hr" if hours == 1 else "hrs"
-            note = ""
-            if not day.is_complete:
-                note = f" (incomplete: {day.samples_present}/24 hours logged)"
-            hours_text = f"{hours} {suffix}"
-            line = (
-                f"  {weekday}: "
-                f"{_colorize_hours_text(hours_text, hours=float(hours), threshold=usage_threshold, use_color=use_color)}"
-                f"{note}"
+            hours_text = colorize(
+                f"{hours} hr" if hours == 1 else f"{hours} hrs", hours
             )
-            lines.append(line)
-            if verbose and day.below_threshold_hours:
-                times = ", ".join(h.strftime("%H:%M") for h in day.below_threshold_hours)
+            weekday = _format_day(day.day)
+            if day.is_complete:
+                lines.append(f"  {weekday}: {hours_text}")
+            else:
                 lines.append(
-                    f"    below {temp_threshold:.1f}°F at: {times}"
+                    f"  {weekday}: {hours_text}"
+                    f" (incomplete: {day.samples_present}/24 hours logged)"
                 )
+            if verbose and day.below_threshold_hours:
+                times = ", ".join(
+                    f"{h.hour:02d}:{h.minute:02d}" for h in day.below_threshold_hours
+                )
+                lines.append(f"{below_prefix}{times}")
         lines.append("")
     return "\n".join(lines).strip()
 
 
-def _colorize_hours_text(
-    text: str,
-    *,
-    hours: float,
-    threshold: float,
-    use_color: bool,
-) -> str:
-    """Wrap an ``hours`` display fragment in ANSI color codes."""
+@lru_cache(maxsize=1024)
+def _format_day(day: date) -> str:
+    """Format ``day`` for text output; cached since strftime is locale-bound."""
 
-    if not use_color:
-        return text
+    return day.strftime("%a %Y-%m-%d")
+
+
+def _hours_colorizer(threshold: float, use_color: bool) -> Callable[[str, float], str]:
+    """Return a function wrapping ``hours`` display fragments in ANSI colors.
 
-    color = _color_for_hours(hours, threshold)
-    return f"{color}{text}{ANSI_RESET}"
+    The cutoffs are fixed for a whole render, so they are computed once here
+    rather than on every call.
+    """
+
+    if not use_color:
+        return lambda text, hours: text
 
+    green_cutoff = threshold
+    yellow_cutoff = threshold - NEAR_THRESHOLD_BUFFER_HOURS
 
-def _color_for_hours(hours: float, threshold: float) -> str:
-    """Return the ANSI escape sequence for ``hours`` relative to ``threshold``."""
+    def colorize(text: str, hours: float) -> str:
+        if hours >= green_cutoff:
+            return f"{ANSI_GREEN}{text}{ANSI_RESET}"
+        if hours >= yellow_cutoff:
+            return f"{ANSI_YELLOW}{text}{ANSI_RESET}"
+        return f"{ANSI_RED}{text}{ANSI_RESET}"
 
-    delta = hours - threshold
-    if delta >= 0:
-        return ANSI_GREEN
-    if delta >= -NEAR_THRESHOLD_BUFFER_HOURS:
-        return ANSI_YELLOW
-    return ANSI_RED
+    return colorize
 
 
 def _should_use_color(mode: str, stream: TextIO = sys.stdout) -> bool:
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
-import tomllib
-
 
 DEFAULT_CONFIG_PATH = Path("brace_tracker.toml")
 
@@ -28,14 +27,28 @@ def load_config(path: Path | None = None) -> AnalysisConfig:
     """Load analysis configuration from ``path`` or fall back to defaults."""
 
     if path is not None:
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {path}")
-        data = _load_toml(path)
-    elif DEFAULT_CONFIG_PATH.exists():
-        data = _load_toml(DEFAULT_CONFIG_PATH)
-    else:
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {path}") from None
+        return _parse_config(content)
+
+    try:
+        content = DEFAULT_CONFIG_PATH.read_bytes()
+    except FileNotFoundError:
         return AnalysisConfig()
+    return _parse_config(content)
+
+
+@lru_cache(maxsize=8)
+def _parse_config(content: bytes) -> AnalysisConfig:
+    """Build the config from TOML bytes; cached by content.
 
+    The file is small and always re-read, so a rewrite is picked up even when
+    it keeps the same size and modification time.
+    """
+
+    data = _load_toml(content)
     analysis = data.get("analysis", {}) if isinstance(data, Mapping) else {}
 
     return AnalysisConfig(
@@ -52,6 +65,7 @@ def load_config(path: Path | None = None) -> AnalysisConfig:
     )
 
 
-def _load_toml(path: Path) -> Mapping[str, Any]:
-    with path.open("rb") as handle:
-        return tomllib.load(handle)
+def _load_toml(content: bytes) -> Mapping[str, Any]:
+    import tomllib  # Deferred: runs without a config file never parse TOML.
+
+    return tomllib.loads(content.decode())
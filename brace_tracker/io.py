@@ -3,13 +3,31 @@
 from __future__ import annotations
 
 import csv
+import os
+import re
+import sys
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator, List
+from typing import Dict, Iterable, Iterator, List
 
+MAX_READ_WORKERS = 8
+_ONE_HOUR = timedelta(hours=1)
+TIMESTAMP_FORMAT = "%a %b %d %Y %H:%M:%S GMT%z"
 
-@dataclass(frozen=True)
+_MONTHS = {
+    name: index
+    for index, name in enumerate(
+        "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), start=1
+    )
+}
+_WEEKDAYS = frozenset("Mon Tue Wed Thu Fri Sat Sun".split())
+# Offset minutes mirror strptime's %z, which only allows 00-59.
+_DAY_FIELDS_RE = re.compile(r"\w{3} (\w{3}) (\d{2}) (\d{4}) GMT([+-])(\d{2})([0-5]\d)")
+
+
+@dataclass(frozen=True, slots=True)
 class RawRecord:
     """Single CSV row parsed from disk prior to deduplication."""
 
@@ -20,30 +38,65 @@ class RawRecord:
 
 
 def load_raw_records(data_dir: Path) -> List[RawRecord]:
-    """Load all CSV logs from ``data_dir`` into memory."""
+    """Load the CSV logs from ``data_dir`` into memory.
+
+    Only the hottest reading per hour of each file is kept, since that is the
+    only row ``normalize_records`` can select for the hour. Memory therefore
+    scales with logged hours rather than raw sample count.
+    """
 
     if not data_dir.exists():
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
 
+    paths = sorted(_iter_csv_paths(data_dir))
     records: List[RawRecord] = []
-    for path in sorted(_iter_csv_paths(data_dir)):
-        records.extend(_read_csv(path))
+    if len(paths) <= 1:
+        for path in paths:
+            records.extend(_read_csv(path))
+        return records
+
+    # Files are independent, so overlap their disk reads; map() keeps the
+    # sorted path order in the combined result. The import is deferred so
+    # single-file runs do not pay for loading concurrent.futures.
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(MAX_READ_WORKERS, len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for file_records in executor.map(_read_csv, paths):
+            records.extend(file_records)
     return records
 
 
 def _iter_csv_paths(data_dir: Path) -> Iterable[Path]:
-    yield from (p for p in data_dir.glob("*.csv") if p.is_file())
+    # scandir entries cache their file type, avoiding a second stat per path.
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".csv") and entry.is_file():
+                yield Path(entry.path)
 
 
 def _read_csv(path: Path) -> List[RawRecord]:
     device_id = _infer_device_id(path)
-    rows: List[RawRecord] = []
+    hottest: Dict[datetime, RawRecord] = {}
+    hour: datetime | None = None
+    next_hour: datetime | None = None
 
     with path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(_strip_leading_blank_lines(handle))
+        reader = csv.reader(_strip_leading_blank_lines(handle))
+        header = next(reader, None)
+        if header is None or "date" not in header or "temperature" not in header:
+            return []
+
+        # Index columns once instead of building a dict per row.
+        date_index = header.index("date")
+        temp_index = header.index("temperature")
+        min_width = max(date_index, temp_index) + 1
+
         for row in reader:
-            date_raw = (row.get("date") or "").strip()
-            temp_raw = (row.get("temperature") or "").strip()
+            if len(row) < min_width:
+                continue
+            date_raw = row[date_index].strip()
+            temp_raw = row[temp_index].strip()
             if not date_raw or not temp_raw:
                 continue
 
@@ -58,16 +111,32 @@ def _read_csv(path: Path) -> List[RawRecord]:
             except ValueError:
                 continue
 
-            rows.append(
-                RawRecord(
+            # Logs are chronological, so most rows fall in the previous row's
+            # hour; only build a new floored hour (cheaper than replace()) when
+            # the timestamp leaves it or switches UTC offset.
+            if (
+                hour is None
+                or timestamp.tzinfo is not hour.tzinfo
+                or not hour <= timestamp < next_hour
+            ):
+                hour = datetime(
+                    timestamp.year,
+                    timestamp.month,
+                    timestamp.day,
+                    timestamp.hour,
+                    tzinfo=timestamp.tzinfo,
+                )
+                next_hour = hour + _ONE_HOUR
+            existing = hottest.get(hour)
+            if existing is None or temperature > existing.temperature:
+                hottest[hour] = RawRecord(
                     device_id=device_id,
                     timestamp=timestamp,
                     temperature=temperature,
                     source_path=path,
                 )
-            )
 
-    return rows
+    return list(hottest.values())
 
 
 def _strip_leading_blank_lines(handle: Iterable[str]) -> Iterator[str]:
@@ -90,9 +159,62 @@ def _parse_timestamp(raw: str) -> datetime:
 
     # Example: Thu Sep 11 2025 10:54:11 GMT-0500 (Central Daylight Time)
     cleaned = raw.split(" (")[0]
-    return datetime.strptime(cleaned, "%a %b %d %Y %H:%M:%S GMT%z")
+    parts = cleaned.split(" ")
+    if len(parts) == 6:
+        # Samples share their date/offset with the rest of the day and usually
+        # repeat clock readings across days, so both halves are parsed once
+        # per distinct value and each row only assembles the datetime.
+        weekday, month, day, year, clock, zone = parts
+        day_fields = _parse_day_fields(weekday, month, day, year, zone)
+        clock_fields = _parse_clock(clock)
+        if day_fields is not None and clock_fields is not None:
+            year_value, month_value, day_value, tzinfo = day_fields
+            return datetime(
+                year_value, month_value, day_value, *clock_fields, tzinfo=tzinfo
+            )
+
+    # Fall back to strptime for anything outside the common export shape.
+    return datetime.strptime(cleaned, TIMESTAMP_FORMAT)
+
+
+@lru_cache(maxsize=1024)
+def _parse_day_fields(
+    weekday: str, month: str, day: str, year: str, zone: str
+) -> tuple[int, int, int, timezone] | None:
+    """Return ``(year, month, day, tzinfo)`` or ``None`` if the shape is off."""
+
+    if weekday not in _WEEKDAYS:
+        return None
+    match = _DAY_FIELDS_RE.fullmatch(f"{weekday} {month} {day} {year} {zone}")
+    month_value = _MONTHS.get(match.group(1)) if match else None
+    if month_value is None:
+        return None
+
+    sign, off_hours, off_minutes = match.group(4, 5, 6)
+    return int(year), month_value, int(day), _utc_offset(sign, off_hours, off_minutes)
+
+
+@lru_cache(maxsize=4096)
+def _parse_clock(clock: str) -> tuple[int, int, int] | None:
+    """Return ``(hour, minute, second)`` for ``HH:MM:SS`` or ``None``."""
+
+    if len(clock) != 8 or not clock[2] == clock[5] == ":":
+        return None
+    if not clock.replace(":", "").isdigit():
+        return None
+    return int(clock[:2]), int(clock[3:5]), int(clock[6:])
+
+
+@cache
+def _utc_offset(sign: str, hours: str, minutes: str) -> timezone:
+    """Return a shared ``timezone`` for a ``GMT±HHMM`` offset."""
+
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    return timezone(-offset if sign == "-" else offset)
 
 
 def _infer_device_id(path: Path) -> str:
     stem = path.stem
-    return stem.split("_")[0] if "_" in stem else stem
+    # Interned so every file for a device shares one id object; downstream
+    # device comparisons then short-circuit on identity.
+    return sys.intern(stem.split("_")[0] if "_" in stem else stem)
@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from typing import Dict, Iterable, List, Sequence
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Sequence
 
 from .io import RawRecord
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HourlyRecord:
     device_id: str
     hour: datetime
     temperature: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class HourlySeries:
+    """One device's hourly maxima as parallel, hour-sorted columns."""
+
+    hours: Sequence[datetime]
+    temperatures: Sequence[float]
+
+
+@dataclass(frozen=True, slots=True)
 class DailyUsage:
     day: date
     hours_in_use: int
@@ -25,7 +37,7 @@ class DailyUsage:
     is_complete: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceUsage:
     device_id: str
     seven_day_average_hours_per_day: float
@@ -39,20 +51,67 @@ class DeviceUsage:
 def normalize_records(records: Iterable[RawRecord]) -> List[HourlyRecord]:
     """Collapse raw readings down to one record per device/hour."""
 
-    collapsed: Dict[tuple[str, datetime], HourlyRecord] = {}
+    return [
+        HourlyRecord(device_id=device_id, hour=hour, temperature=temperature)
+        for device_id, series in normalize_series(records).items()
+        for hour, temperature in zip(series.hours, series.temperatures)
+    ]
+
+
+def normalize_series(records: Iterable[RawRecord]) -> Dict[str, HourlySeries]:
+    """Collapse raw readings to hourly maxima, keyed by device in sorted order.
+
+    This is the column-oriented form of ``normalize_records``: no per-hour
+    objects are allocated, and devices can be filtered by key.
+    """
+
+    # Reduce to bare floats per device first. Records arrive grouped by file,
+    # so the device map is only looked up when the device changes.
+    per_device: Dict[str, Dict[datetime, float]] = defaultdict(dict)
+    current_device: str | None = None
+    hourly: Dict[datetime, float] = {}
 
     for record in records:
-        floored = record.timestamp.replace(minute=0, second=0, microsecond=0)
-        key = (record.device_id, floored)
-        existing = collapsed.get(key)
-        if existing is None or record.temperature > existing.temperature:
-            collapsed[key] = HourlyRecord(
-                device_id=record.device_id,
-                hour=floored,
-                temperature=record.temperature,
-            )
+        if record.device_id != current_device:
+            current_device = record.device_id
+            hourly = per_device[current_device]
+        timestamp = record.timestamp
+        temperature = record.temperature
+        # Constructing the floored hour is markedly cheaper than replace(), which
+        # dominated this loop.
+        floored = datetime(
+            timestamp.year,
+            timestamp.month,
+            timestamp.day,
+            timestamp.hour,
+            tzinfo=timestamp.tzinfo,
+        )
+        existing = hourly.get(floored)
+        if existing is None:
+            hourly[floored] = temperature
+        elif temperature > existing:
+            # Aware datetimes compare by instant, so the same hour can arrive
+            # under another UTC offset. Re-insert so the key carries the
+            # hottest reading's offset, as the hour's label.
+            del hourly[floored]
+            hourly[floored] = temperature
 
-    return sorted(collapsed.values(), key=lambda r: (r.device_id, r.hour))
+    # Insertion order is usually chronological already (one file per device),
+    # in which case the dict's own key/value order is used as-is. Otherwise
+    # sort the hours and look the maxima up in C via map(). Temperatures are
+    # packed into a typed array: 8 bytes each instead of a boxed float.
+    series: Dict[str, HourlySeries] = {}
+    for device_id in sorted(per_device):
+        maxima = per_device[device_id]
+        hours = list(maxima)
+        ordered_hours = sorted(hours)
+        if hours == ordered_hours:
+            temperatures = array("d", maxima.values())
+        else:
+            hours = ordered_hours
+            temperatures = array("d", map(maxima.__getitem__, hours))
+        series[device_id] = HourlySeries(hours=hours, temperatures=temperatures)
+    return series
 
 
 def compute_device_usage(
@@ -61,48 +120,81 @@ def compute_device_usage(
     usage_threshold: float,
     temperature_threshold: float,
     window_days: int,
+    collect_below_threshold: bool = True,
 ) -> List[DeviceUsage]:
-    """Summarize usage for each device over the trailing window."""
+    """Summarize usage for each device over the trailing window.
+
+    Records may arrive in any order; devices are summarized in ascending
+    device order. Pass ``collect_below_threshold=False`` when the per-day
+    below-threshold hours are not needed; they are then left empty instead of
+    being gathered.
+    """
 
-    per_device: Dict[str, List[HourlyRecord]] = {}
+    # Split records into per-device hour/temperature columns and hand them to
+    # the same summary path the CLI uses.
+    columns: Dict[str, tuple[List[datetime], List[float]]] = {}
     for record in hourly_records:
-        per_device.setdefault(record.device_id, []).append(record)
-
-    summaries: List[DeviceUsage] = []
-    for device_id, device_records in sorted(per_device.items()):
-        device_records.sort(key=lambda r: r.hour)
-        summaries.append(
-            _summarize_device(
-                device_id=device_id,
-                records=device_records,
-                usage_threshold=usage_threshold,
-                temperature_threshold=temperature_threshold,
-                window_days=window_days,
-            )
-        )
+        device_columns = columns.get(record.device_id)
+        if device_columns is None:
+            device_columns = columns[record.device_id] = ([], [])
+        device_columns[0].append(record.hour)
+        device_columns[1].append(record.temperature)
+
+    series: Dict[str, HourlySeries] = {}
+    for device_id in sorted(columns):
+        hours, temperatures = columns[device_id]
+        # Hours are normally already in order; this check stays in C and only
+        # out-of-order input pays for a (stable) reorder.
+        if hours != sorted(hours):
+            order = sorted(range(len(hours)), key=hours.__getitem__)
+            hours = [hours[index] for index in order]
+            temperatures = [temperatures[index] for index in order]
+        series[device_id] = HourlySeries(hours=hours, temperatures=temperatures)
+
+    return compute_series_usage(
+        series,
+        usage_threshold=usage_threshold,
+        temperature_threshold=temperature_threshold,
+        window_days=window_days,
+        collect_below_threshold=collect_below_threshold,
+    )
+
+
+def compute_series_usage(
+    series: Mapping[str, HourlySeries],
+    *,
+    usage_threshold: float,
+    temperature_threshold: float,
+    window_days: int,
+    collect_below_threshold: bool = True,
+) -> List[DeviceUsage]:
+    """Summarize usage for each device's ``HourlySeries``, in mapping order."""
 
-    return summaries
+    return [
+        _summarize_device(
+            device_id=device_id,
+            hours=device_series.hours,
+            temperatures=device_series.temperatures,
+            usage_threshold=usage_threshold,
+            temperature_threshold=temperature_threshold,
+            window_days=window_days,
+            collect_below_threshold=collect_below_threshold,
+        )
+        for device_id, device_series in series.items()
+    ]
 
 
 def _summarize_device(
     *,
     device_id: str,
-    records: Sequence[HourlyRecord],
+    hours: Sequence[datetime],
+    temperatures: Sequence[float],
     usage_threshold: float,
     temperature_threshold: float,
     window_days: int,
+    collect_below_threshold: bool,
 ) -> DeviceUsage:
-    hours_in_use_by_day: Dict[date, int] = {}
-    below_threshold_by_day: Dict[date, List[datetime]] = {}
-
-    for record in records:
-        local_day = record.hour.date()
-        if record.temperature > temperature_threshold:
-            hours_in_use_by_day[local_day] = hours_in_use_by_day.get(local_day, 0) + 1
-        else:
-            below_threshold_by_day.setdefault(local_day, []).append(record.hour)
-
-    if not records:
+    if not hours:
         return DeviceUsage(
             device_id=device_id,
             seven_day_average_hours_per_day=0.0,
@@ -113,36 +205,60 @@ def _summarize_device(
             complete_days_overall=0,
         )
 
-    anchor_day = records[-1].hour.date()
+    anchor = hours[-1]
+    first_ordinal = anchor.toordinal() - (window_days - 1)
+    # Hours are sorted, so binary-search past history that predates
+    # the window. UTC offsets span -12:00 to +14:00, more than a day apart,
+    # so the cutoff keeps two days of slack; _bucket_by_day still filters
+    # by exact local day.
+    cutoff = datetime.combine(
+        date.fromordinal(first_ordinal - 2), time(), tzinfo=anchor.tzinfo
+    )
+    start = bisect_left(hours, cutoff)
+    hours_in_use_by_offset, samples_by_offset, below_threshold_by_offset = (
+        _bucket_by_day(
+            hours[start:],
+            temperatures[start:],
+            first_ordinal=first_ordinal,
+            window_days=window_days,
+            temperature_threshold=temperature_threshold,
+            collect_below_threshold=collect_below_threshold,
+        )
+    )
+
     window: List[DailyUsage] = []
+    window_dates = _window_dates(first_ordinal, window_days)
+    recent_start = window_days - 7
+    complete_days_overall = total_hours_overall = 0
+    complete_days_recent = total_hours_recent = 0
 
+    # Accumulate the overall and trailing-7-day totals while building the
+    # window instead of rescanning it afterwards.
     for offset in range(window_days):
-        target_day = anchor_day - timedelta(days=window_days - 1 - offset)
-        hours_in_use = hours_in_use_by_day.get(target_day, 0)
-        below_hours = tuple(sorted(below_threshold_by_day.get(target_day, ())))
-        sample_count = hours_in_use + len(below_hours)
+        hours_in_use = hours_in_use_by_offset[offset]
+        sample_count = samples_by_offset[offset]
         meets_sample_requirement = sample_count == 24
+        if meets_sample_requirement:
+            complete_days_overall += 1
+            total_hours_overall += hours_in_use
+            if offset >= recent_start:
+                complete_days_recent += 1
+                total_hours_recent += hours_in_use
 
         window.append(
             DailyUsage(
-                day=target_day,
+                day=window_dates[offset],
                 hours_in_use=hours_in_use,
-                below_threshold_hours=below_hours,
+                # Collected from hour-sorted input, so already chronological.
+                below_threshold_hours=tuple(below_threshold_by_offset[offset]),
                 samples_present=sample_count,
                 is_complete=meets_sample_requirement,
             )
         )
 
-    complete_days_overall = sum(1 for day in window if day.is_complete)
-    total_hours_overall = sum(day.hours_in_use for day in window if day.is_complete)
     overall_average = (
         total_hours_overall / complete_days_overall if complete_days_overall else 0.0
     )
-
-    recent_window_size = min(7, len(window))
-    recent_days = window[-recent_window_size:] if window else []
-    complete_days_recent = sum(1 for day in recent_days if day.is_complete)
-    total_hours_recent = sum(day.hours_in_use for day in recent_days if day.is_complete)
     seven_day_average = (
         total_hours_recent / complete_days_recent if complete_days_recent else 0.0
     )
@@ -156,3 +272,58 @@ def _summarize_device(
         complete_days_last_seven=complete_days_recent,
         complete_days_overall=complete_days_overall,
     )
+
+
+@lru_cache(maxsize=32)
+def _window_dates(first_ordinal: int, window_days: int) -> tuple[date, ...]:
+    """Return the window's dates; devices usually share the same window."""
+
+    return tuple(
+        date.fromordinal(ordinal)
+        for ordinal in range(first_ordinal, first_ordinal + window_days)
+    )
+
+
+def _bucket_by_day(
+    hours: Iterable[datetime],
+    temperatures: Iterable[float],
+    *,
+    first_ordinal: int,
+    window_days: int,
+    temperature_threshold: float,
+    collect_below_threshold: bool,
+) -> tuple[List[int], List[int], List[Sequence[datetime]]]:
+    """Count hours in use and samples per window day in a single pass.
+
+    Days are indexed by their offset from ``first_ordinal`` (a date ordinal),
+    which avoids allocating a ``date`` per hour; hours outside the window
+    are skipped. Below-threshold hours are collected per day only when
+    ``collect_below_threshold`` is set; otherwise every day shares one empty
+    tuple and nothing is allocated for them.
+    """
+
+    hours_in_use = [0] * window_days
+    samples = [0] * window_days
+
+    if not collect_below_threshold:
+        # Specialized loop for the common case: ordinals come from a C-level
+        # map and there is no per-hour collection branch.
+        for ordinal, temperature in zip(map(datetime.toordinal, hours), temperatures):
+            offset = ordinal - first_ordinal
+            if 0 <= offset < window_days:
+                samples[offset] += 1
+                if temperature > temperature_threshold:
+                    hours_in_use[offset] += 1
+        return hours_in_use, samples, [()] * window_days
+
+    below_threshold: List[List[datetime]] = [[] for _ in range(window_days)]
+    for hour, temperature in zip(hours, temperatures):
+        offset = hour.toordinal() - first_ordinal
+        if 0 <= offset < window_days:
+            samples[offset] += 1
+            if temperature > temperature_threshold:
+                hours_in_use[offset] += 1
+            else:
+                below_threshold[offset].append(hour)
+
+    return hours_in_use, samples, below_threshold
@@ -1,3 +1,4 @@
+import json
 import os
 import subprocess
 import sys
@@ -200,3 +201,46 @@ def test_cli_respects_no_color_env(tmp_path):
 
     assert "\033[" not in result.stdout
 
+
+def test_cli_json_serializes_days_and_hours(tmp_path):
+    data_dir = tmp_path
+    csv_path = data_dir / "EPSILON_log.csv"
+
+    lines = ["", "index,date,temperature"]
+    start = datetime(2025, 9, 11, 0, 0, tzinfo=CENTRAL)
+    for index, hour in enumerate(range(24)):
+        timestamp = start + timedelta(hours=hour)
+        temp = 80 if hour == 3 else 95
+        lines.append(f"{index},{format_timestamp(timestamp)},{temp}")
+    csv_path.write_text("\r\n".join(lines), encoding="utf-8")
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "brace_tracker",
+            "--data-dir",
+            str(data_dir),
+            "--days",
+            "1",
+            "--json",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    payload = json.loads(result.stdout)
+    assert len(payload) == 1
+    usage = payload[0]
+    assert usage["device_id"] == "EPSILON"
+    assert usage["complete_days_overall"] == 1
+    assert usage["days"] == [
+        {
+            "below_threshold_hours": ["2025-09-11 03:00:00-05:00"],
+            "day": "2025-09-11",
+            "hours_in_use": 23,
+            "is_complete": True,
+            "samples_present": 24,
+        }
+    ]
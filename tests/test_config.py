@@ -35,3 +35,13 @@ window_days = 5
 def test_load_config_raises_for_missing_path(tmp_path):
     with pytest.raises(FileNotFoundError):
         load_config(tmp_path / "missing.toml")
+
+
+def test_load_config_reloads_when_file_changes(tmp_path):
+    config_path = tmp_path / "custom.toml"
+    config_path.write_text("[analysis]\nwindow_days = 5\n", encoding="utf-8")
+    assert load_config(config_path).window_days == 5
+
+    config_path.write_text("[analysis]\nwindow_days = 9\n", encoding="utf-8")
+
+    assert load_config(config_path).window_days == 9
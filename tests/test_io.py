@@ -1,6 +1,14 @@
+from datetime import datetime
 from pathlib import Path
 
-from brace_tracker.io import RawRecord, load_raw_records
+import pytest
+
+from brace_tracker.io import (
+    TIMESTAMP_FORMAT,
+    RawRecord,
+    _parse_timestamp,
+    load_raw_records,
+)
 
 
 def test_load_raw_records_parses_timestamps(tmp_path):
@@ -22,3 +30,77 @@ def test_load_raw_records_parses_timestamps(tmp_path):
     assert first.timestamp.tzinfo is not None
     assert first.temperature == 91.5
     assert first.source_path == csv_path
+
+
+def test_load_raw_records_skips_blank_and_malformed_rows(tmp_path):
+    sample = (
+        "index,date,temperature\r\n"
+        "0,Thu Sep 11 2025 10:54:11 GMT-0500 (Central Daylight Time),91.5\r\n"
+        "1,,92.5\r\n"
+        "2,not a timestamp,93.0\r\n"
+        "3,Thu Sep 11 2025 12:54:11 GMT-0500 (Central Daylight Time),n/a\r\n"
+        "4\r\n"
+    )
+    csv_path = tmp_path / "DEVICE_log.csv"
+    csv_path.write_text(sample, encoding="utf-8")
+
+    records = load_raw_records(tmp_path)
+
+    assert [r.temperature for r in records] == [91.5]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "Thu Sep 11 2025 10:54:11 GMT-0500 (Central Daylight Time)",
+        "Sun Nov 02 2025 01:04:11 GMT-0600 (Central Standard Time)",
+        "Mon Sep 15 2025 23:59:59 GMT+0530",
+        "Mon Sep 1 2025 08:00:00 GMT+0000",
+        "Foo Sep 11 2025 10:00:00 GMT-0500",
+        "Thu Sep 11 2025 10:00:00 GMT-0575",
+    ],
+)
+def test_parse_timestamp_matches_strptime(raw):
+    try:
+        expected = datetime.strptime(raw.split(" (")[0], TIMESTAMP_FORMAT)
+    except ValueError:
+        with pytest.raises(ValueError):
+            _parse_timestamp(raw)
+        return
+
+    parsed = _parse_timestamp(raw)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_load_raw_records_keeps_hottest_reading_per_hour(tmp_path):
+    sample = (
+        "index,date,temperature\r\n"
+        "0,Thu Sep 11 2025 10:05:00 GMT-0500 (Central Daylight Time),88.0\r\n"
+        "1,Thu Sep 11 2025 10:35:00 GMT-0500 (Central Daylight Time),93.0\r\n"
+        "2,Thu Sep 11 2025 10:55:00 GMT-0500 (Central Daylight Time),90.0\r\n"
+        "3,Thu Sep 11 2025 11:05:00 GMT-0500 (Central Daylight Time),85.0\r\n"
+    )
+    csv_path = tmp_path / "DEVICE_log.csv"
+    csv_path.write_text(sample, encoding="utf-8")
+
+    records = load_raw_records(tmp_path)
+
+    assert [(r.timestamp.minute, r.temperature) for r in records] == [
+        (35, 93.0),
+        (5, 85.0),
+    ]
+
+
+def test_load_raw_records_combines_files_in_path_order(tmp_path):
+    header = "index,date,temperature\r\n"
+    row = "0,Thu Sep 11 2025 10:00:00 GMT-0500 (Central Daylight Time),{}\r\n"
+    for name, temp in [("CHARLIE", 93.0), ("ALPHA", 91.0), ("BRAVO", 92.0)]:
+        (tmp_path / f"{name}_log.csv").write_text(
+            header + row.format(temp), encoding="utf-8"
+        )
+
+    records = load_raw_records(tmp_path)
+
+    assert [r.device_id for r in records] == ["ALPHA", "BRAVO", "CHARLIE"]
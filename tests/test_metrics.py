@@ -6,7 +6,9 @@ from brace_tracker.metrics import (
     DeviceUsage,
     HourlyRecord,
     compute_device_usage,
+    compute_series_usage,
     normalize_records,
+    normalize_series,
 )
 
 FMT = "%Y-%m-%d %H:%M%z"
@@ -153,3 +155,195 @@ def test_compute_device_usage_reports_recent_and_overall_averages():
     assert abs(usage.seven_day_average_hours_per_day - 10.0) < 1e-6
     assert abs(usage.overall_average_hours_per_day - 13.0) < 1e-6
     assert usage.threshold_met is False
+
+
+def test_compute_device_usage_ignores_history_before_window():
+    records = []
+    start = dt("2025-08-01 00:00-0500")
+    for day_offset in range(30):
+        for hour_offset in range(24):
+            timestamp = start + timedelta(days=day_offset, hours=hour_offset)
+            hot_hours = 20 if day_offset < 23 else 10
+            temp = 95.0 if hour_offset < hot_hours else 80.0
+            records.append(
+                RawRecord(
+                    device_id="alpha",
+                    timestamp=timestamp,
+                    temperature=temp,
+                    source_path=Path("alpha.csv"),
+                )
+            )
+
+    usage = compute_device_usage(
+        normalize_records(records),
+        usage_threshold=16.0,
+        temperature_threshold=90.0,
+        window_days=7,
+    )[0]
+
+    assert [day.day for day in usage.days] == [
+        (start + timedelta(days=offset)).date() for offset in range(23, 30)
+    ]
+    assert all(day.hours_in_use == 10 for day in usage.days)
+    assert all(day.is_complete for day in usage.days)
+    assert abs(usage.seven_day_average_hours_per_day - 10.0) < 1e-6
+
+
+def test_compute_device_usage_accepts_unsorted_hours():
+    records = []
+    start = dt("2025-09-11 00:00-0500")
+    for hour_offset in range(48):
+        temp = 95.0 if hour_offset % 24 < 18 else 80.0
+        records.append(
+            HourlyRecord(
+                device_id="alpha",
+                hour=start + timedelta(hours=hour_offset),
+                temperature=temp,
+            )
+        )
+
+    kwargs = dict(usage_threshold=16.0, temperature_threshold=90.0, window_days=2)
+    expected = compute_device_usage(records, **kwargs)
+
+    assert compute_device_usage(list(reversed(records)), **kwargs) == expected
+    assert [day.hours_in_use for day in expected[0].days] == [18, 18]
+
+
+def test_compute_device_usage_can_skip_below_threshold_hours():
+    records = [
+        build_record("alpha", "2025-09-11 10:00-0500", 95.0),
+        build_record("alpha", "2025-09-11 11:00-0500", 80.0),
+    ]
+
+    usage = compute_device_usage(
+        normalize_records(records),
+        usage_threshold=16.0,
+        temperature_threshold=90.0,
+        window_days=1,
+        collect_below_threshold=False,
+    )[0]
+
+    assert usage.days[0].hours_in_use == 1
+    assert usage.days[0].samples_present == 2
+    assert usage.days[0].below_threshold_hours == ()
+
+
+def test_normalize_series_matches_normalize_records():
+    records = [
+        build_record("beta", "2025-09-11 11:20-0500", 91.0),
+        build_record("alpha", "2025-09-11 10:45-0500", 95.0),
+        build_record("alpha", "2025-09-11 09:05-0500", 82.0),
+        build_record("alpha", "2025-09-11 10:15-0500", 85.0),
+    ]
+
+    series = normalize_series(records)
+
+    assert list(series) == ["alpha", "beta"]
+    assert series["alpha"].hours == [
+        dt("2025-09-11 09:00-0500"),
+        dt("2025-09-11 10:00-0500"),
+    ]
+    assert list(series["alpha"].temperatures) == [82.0, 95.0]
+    assert normalize_records(records) == [
+        HourlyRecord(device_id=device_id, hour=hour, temperature=temperature)
+        for device_id, device_series in series.items()
+        for hour, temperature in zip(device_series.hours, device_series.temperatures)
+    ]
+
+    kwargs = dict(usage_threshold=16.0, temperature_threshold=90.0, window_days=3)
+    assert compute_series_usage(series, **kwargs) == compute_device_usage(
+        normalize_records(records), **kwargs
+    )
+
+
+def test_compute_device_usage_buckets_by_local_day_across_offset_change():
+    records = []
+    # 2025-11-02: clocks fall back from -0500 to -0600 mid-day.
+    for hour_offset in range(12):
+        records.append(
+            build_record("alpha", f"2025-11-02 {hour_offset:02d}:30-0500", 95.0)
+        )
+    for hour_offset in range(12, 24):
+        records.append(
+            build_record("alpha", f"2025-11-02 {hour_offset:02d}:30-0600", 80.0)
+        )
+    records.append(build_record("alpha", "2025-11-03 00:30-0600", 95.0))
+
+    usage = compute_device_usage(
+        normalize_records(records),
+        usage_threshold=16.0,
+        temperature_threshold=90.0,
+        window_days=2,
+    )[0]
+
+    first, second = usage.days
+    assert first.day == dt("2025-11-02 00:00-0600").date()
+    assert (first.hours_in_use, first.samples_present) == (12, 24)
+    assert first.is_complete
+    assert (second.hours_in_use, second.samples_present) == (1, 1)
+
+
+def test_compute_device_usage_accepts_records_in_any_order():
+    start = dt("2025-09-10 00:00-0500")
+    records = [
+        HourlyRecord(
+            device_id=device,
+            hour=start + timedelta(hours=offset),
+            temperature=95.0 if offset % 3 else 80.0,
+        )
+        for device in ("alpha", "beta")
+        for offset in range(48)
+    ]
+    kwargs = dict(usage_threshold=16.0, temperature_threshold=90.0, window_days=2)
+
+    ordered = compute_device_usage(records, **kwargs)
+    shuffled = compute_device_usage(records[::-1], **kwargs)
+
+    assert [usage.device_id for usage in shuffled] == ["alpha", "beta"]
+    assert shuffled == ordered
+
+
+def test_normalize_labels_hour_with_hottest_reading_offset():
+    records = [
+        RawRecord(
+            device_id="alpha",
+            timestamp=dt("2025-11-02 00:30-0600"),
+            temperature=80.0,
+            source_path=Path("alpha_cst.csv"),
+        ),
+        RawRecord(
+            device_id="alpha",
+            timestamp=dt("2025-11-02 01:10-0500"),
+            temperature=85.0,
+            source_path=Path("alpha_cdt.csv"),
+        ),
+    ]
+
+    normalized = normalize_records(records)
+    series = normalize_series(records)["alpha"]
+
+    assert len(normalized) == 1
+    assert normalized[0].temperature == 85.0
+    assert normalized[0].hour.hour == 1
+    assert normalized[0].hour.utcoffset() == timedelta(hours=-5)
+    assert [hour.utcoffset() for hour in series.hours] == [timedelta(hours=-5)]
+
+
+def test_compute_device_usage_keeps_window_hours_across_wide_offsets():
+    records = [
+        HourlyRecord(
+            device_id="alpha", hour=dt("2025-09-10 00:00+1400"), temperature=95.0
+        ),
+        HourlyRecord(
+            device_id="alpha", hour=dt("2025-09-11 12:00-1200"), temperature=95.0
+        ),
+    ]
+
+    (usage,) = compute_device_usage(
+        records,
+        usage_threshold=0.0,
+        temperature_threshold=90.0,
+        window_days=2,
+    )
+
+    assert [day.samples_present for day in usage.days] == [1, 1]